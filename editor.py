@@ -1,14 +1,187 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, ttk
 import customtkinter as ctk
+import bisect
+import functools
+import hashlib
 import os
+import queue
+import re
 import shutil
-from pygments import lex
-from pygments.lexers import get_lexer_for_filename, guess_lexer_for_filename, TextLexer
-from pygments.token import Token, Text
-from pygments.util import ClassNotFound
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pygments.token import Token
 from pygments.styles import get_style_by_name
 
+# Deferred Pygments machinery: importing pygments.lexers scans the whole
+# lexer registry and dominates module import time, yet it is only needed
+# once a file actually gets highlighted. Loaded on first use instead.
+lex = None
+get_lexer_for_filename = None
+TextLexer = None
+ClassNotFound = None
+
+
+def _load_pygments():
+    """Imports the heavy Pygments lexer machinery on first use."""
+    global lex, get_lexer_for_filename, TextLexer, ClassNotFound
+    if lex is not None:
+        return
+    from pygments import lex as _lex
+    from pygments.lexers import get_lexer_for_filename as _get_lexer, TextLexer as _TextLexer
+    from pygments.util import ClassNotFound as _ClassNotFound
+    lex = _lex
+    get_lexer_for_filename = _get_lexer
+    TextLexer = _TextLexer
+    ClassNotFound = _ClassNotFound
+
+
+@functools.lru_cache(maxsize=128)
+def _lexer_for_ext(ext):
+    """
+    Returns a shared lexer instance for a file extension.
+
+    Lexer lookup scans the Pygments plugin registry and constructs a new
+    instance on every call, which is expensive to repeat for each file open.
+    Lexers are stateless with respect to their input, so caching one per
+    extension is safe.
+    """
+    _load_pygments()
+    try:
+        return get_lexer_for_filename("x" + ext)
+    except ClassNotFound:
+        # Fallback to a plain text lexer if no specific lexer is found
+        return TextLexer()
+
+
+def _hash_content(text):
+    """Short digest of editor content, used to detect unchanged reloads."""
+    return hashlib.blake2b(text.encode('utf-8', 'replace'), digest_size=8).digest()
+
+
+def _line_start_offsets(text):
+    """
+    Builds the character offset of each line start in a text snapshot.
+    Computed once per pass so any character offset can be converted to a
+    Tk line.col index with Python arithmetic instead of Tcl index parsing.
+    """
+    line_starts = [0]
+    pos = text.find('\n')
+    while pos != -1:
+        line_starts.append(pos + 1)
+        pos = text.find('\n', pos + 1)
+    return line_starts
+
+
+def _offset_to_index(line_starts, offset):
+    """
+    Converts a character offset into a Tk "line.col" index string in
+    O(log n) via bisect over the line-start offset table.
+    """
+    line = bisect.bisect_right(line_starts, offset) - 1
+    return f"{line + 1}.{offset - line_starts[line]}"
+
+
+def _token_ranges(tokens, start_line):
+    """
+    Converts lexer tokens into Tk tag ranges grouped by tag name.
+
+    Walks (tag_name, content) pairs, advancing a line/column cursor in pure
+    Python. Isolated as a module function so the compiled variant in
+    _editor_fast.pyx can replace it when built; the interface is identical.
+
+    Args:
+        tokens: Iterable of (tag_name, content) pairs.
+        start_line (int): 1-based line the first token starts on.
+
+    Returns:
+        dict: tag_name -> flat list of alternating start/end index strings.
+    """
+    ranges_by_tag = {}
+    line = start_line
+    col = 0
+    for tag_name, content in tokens:
+        newlines = content.count('\n')
+        if newlines:
+            new_line = line + newlines
+            new_col = len(content) - content.rfind('\n') - 1
+        else:
+            new_line = line
+            new_col = col + len(content)
+        ranges = ranges_by_tag.setdefault(tag_name, [])
+        ranges.append(f"{line}.{col}")
+        ranges.append(f"{new_line}.{new_col}")
+        line, col = new_line, new_col
+    return ranges_by_tag
+
+
+try:
+    # Optional compiled fast path (build _editor_fast.pyx with Cython);
+    # the pure-Python implementation above is the fallback.
+    from _editor_fast import token_ranges as _token_ranges  # noqa: F811
+except ImportError:
+    pass
+
+
+@functools.lru_cache(maxsize=8)
+def _compute_tag_specs(style):
+    """
+    Computes the Tkinter tag options for every token type of a Pygments style.
+
+    Style classes are immutable, so the resulting spec list is cached per
+    style: multiple editors sharing a style pay the iteration and font-tuple
+    construction cost only once.
+
+    Returns:
+        tuple: Pairs of (tag_name, options_dict) ready for tag_config.
+    """
+    default_font_family = "Courier New"
+    default_font_size = 13
+    background = style.background_color or "#282C34"
+
+    # All 8 possible font variants, built up front so the per-token loop
+    # indexes a dict instead of joining a style list per tag.
+    fonts = {}
+    for bold in (False, True):
+        for italic in (False, True):
+            for underline in (False, True):
+                styles = ["normal"]
+                if bold:
+                    styles.append("bold")
+                if italic:
+                    styles.append("italic")
+                if underline:
+                    styles.append("underline")
+                fonts[(bold, italic, underline)] = (
+                    default_font_family, default_font_size, " ".join(styles))
+
+    specs = []
+    for token_type, style_options in style:
+        tag_name = str(token_type)
+        tk_tag_options = {}
+
+        if style_options['color']:
+            hex_color = "#" + style_options['color']
+            # Special handling for black text on dark background to ensure readability
+            if token_type is Token.Text and hex_color == "#000000" and background != "#FFFFFF":
+                tk_tag_options['foreground'] = "#ABB2BF"
+            else:
+                tk_tag_options['foreground'] = hex_color
+
+        if style_options['bgcolor']:
+            tk_tag_options['background'] = "#" + style_options['bgcolor']
+
+        font_key = (bool(style_options['bold']), bool(style_options['italic']),
+                    bool(style_options['underline']))
+        tk_tag_options['font'] = fonts[font_key]
+
+        if tk_tag_options:
+            specs.append((tag_name, tk_tag_options))
+
+    return tuple(specs)
+
 
 class CodeEditor(ctk.CTkFrame):
     """
@@ -36,6 +209,43 @@ class CodeEditor(ctk.CTkFrame):
         self.search_dialog = None
         self.current_search_match_indices = None  # Stores (start, end) of the current search highlight
 
+        # Handles of the pending debounced highlight/resize jobs
+        self._highlight_job = None
+        self._configure_job = None
+
+        # Reused by every Text.search call that needs count=; allocating a
+        # fresh Tcl variable per search registers a new trace each time.
+        self._search_count_var = tk.IntVar(master=self)
+
+        # Number of lines currently rendered in the line-number widget
+        self._line_count = 0
+
+        # Last scroll fraction forwarded to the line-number widget
+        self._last_scroll_fraction = None
+
+        # Snapshot of the buffer (plus its line-start table) reused by
+        # occurrence scans; invalidated whenever the content changes so a
+        # cursor drag doesn't re-read the whole buffer per <<Selection>>.
+        self._buffer_snapshot = None
+        self._buffer_line_starts = None
+        self._buffer_dirty = True
+
+        # Digest of the content last loaded via set_text; None once the user
+        # edits. Lets callers skip redundant reloads of identical content.
+        self._content_hash = None
+
+        # Pygments tags actually applied by previous highlight passes; clears
+        # then scale with tags used in the document, not with tags defined.
+        self._tags_used = set()
+
+        # Background lexing: edits post (generation, code, ...) jobs to a
+        # worker thread so Pygments never blocks the UI; results carry the
+        # generation so stale passes are dropped before tagging.
+        self._lex_generation = 0
+        self._lex_queue = queue.Queue(maxsize=1)
+        self._lex_results = queue.Queue()
+        threading.Thread(target=self._lex_worker, daemon=True).start()
+
         # Configure grid for the editor frame:
         # Column 0 for line numbers (fixed width), Column 1 for editor (expands)
         self.grid_rowconfigure(0, weight=1)
@@ -87,10 +297,12 @@ class CodeEditor(ctk.CTkFrame):
         # Set up Pygments-based text tags for syntax highlighting
         self.setup_tags()
 
-        # Bind events to trigger highlighting and line number updates
+        # Bind events to trigger highlighting and line number updates.
+        # Resizes do not change the tokens, so <Configure> only refreshes
+        # the line numbers (debounced: drags fire dozens of events/sec).
         self.file_editor.bind("<KeyRelease>", self._on_editor_content_change)
         self.file_editor.bind("<ButtonRelease-1>", self._on_editor_content_change)
-        self.file_editor.bind("<Configure>", self._on_editor_content_change)
+        self.file_editor.bind("<Configure>", self._on_configure)
 
         # Bind for occurrence highlighting on selection change
         self.file_editor.bind("<<Selection>>", self._on_selection_change)
@@ -100,6 +312,8 @@ class CodeEditor(ctk.CTkFrame):
 
         # Initial call to update line numbers after a short delay
         self.after(200, self._update_line_numbers_content)
+        # Start polling for finished background lex passes (~60Hz)
+        self.after(16, self._poll_lex_results)
 
     def setup_tags(self):
         """
@@ -122,36 +336,9 @@ class CodeEditor(ctk.CTkFrame):
         # Configure a default tag for plain text
         text_widget.tag_config(str(Token.Text), foreground="#ABB2BF", font=default_font)
 
-        # Iterate through Pygments style definitions and create corresponding Tkinter tags
-        for token_type, style_options in self.pygments_style:
-            tag_name = str(token_type)
-            tk_tag_options = {}
-
-            if style_options['color']:
-                hex_color = "#" + style_options['color']
-                # Special handling for black text on dark background to ensure readability
-                if token_type is Token.Text and hex_color == "#000000" and text_widget.cget("bg") != "#FFFFFF":
-                    tk_tag_options['foreground'] = "#ABB2BF"
-                else:
-                    tk_tag_options['foreground'] = hex_color
-
-            if style_options['bgcolor']:
-                tk_tag_options['background'] = "#" + style_options['bgcolor']
-
-            current_styles_list = list(default_font_base_styles)
-            if style_options['bold']:  # Check for bold style
-                current_styles_list.append("bold")
-            if style_options['italic']:
-                current_styles_list.append("italic")
-            if style_options['underline']:
-                current_styles_list.append("underline")
-
-            font_styles_string = " ".join(current_styles_list)
-            tk_tag_options['font'] = (default_font_family, default_font_size, font_styles_string)
-
-            # Apply the tag configuration if any options were set
-            if tk_tag_options:
-                text_widget.tag_config(tag_name, **tk_tag_options)
+        # Apply the cached per-style tag specs (computed once per Pygments style)
+        for tag_name, tk_tag_options in _compute_tag_specs(self.pygments_style):
+            text_widget.tag_config(tag_name, **tk_tag_options)
 
         # Configure a specific tag for Pygments Generic.Error tokens
         text_widget.tag_config(str(Token.Generic.Error), foreground="#FF0000", underline=True,
@@ -171,12 +358,10 @@ class CodeEditor(ctk.CTkFrame):
         Returns:
             pygments.lexer.Lexer: The determined lexer, or TextLexer if not found.
         """
-        try:
-            lexer = get_lexer_for_filename(filepath)
-            return lexer
-        except ClassNotFound:
-            # Fallback to a plain text lexer if no specific lexer is found
-            return TextLexer()
+        # Key the cache on the lowercased extension so repeat opens of the
+        # same file type reuse a single lexer instance.
+        ext = os.path.splitext(filepath)[1].lower()
+        return _lexer_for_ext(ext)
 
     def set_lexer(self, filename=''):
         """
@@ -188,64 +373,203 @@ class CodeEditor(ctk.CTkFrame):
         self.current_lexer = self.get_lexer_from_filename(filename)
         self.highlight_text()
 
+    def _is_plain_text(self):
+        """
+        Returns True when the current lexer is the TextLexer fallback, in
+        which case highlighting would tag the whole buffer as plain text
+        for no visual gain.
+        """
+        return TextLexer is not None and isinstance(self.current_lexer, TextLexer)
+
     def highlight_text(self, event=None):
         """
-        Applies syntax highlighting to the text in the editor using the current lexer.
-        Removes existing Pygments-related tags and re-applies them based on token types.
-        Preserves selection, occurrence, and search highlight tags.
+        Applies syntax highlighting to the entire document.
+        Only used for full reloads (set_text/set_lexer); incremental edits go
+        through _highlight_visible instead.
         """
+        # A full pass supersedes any in-flight background lex of the old
+        # buffer; bump the generation so a late result from it is dropped
+        # instead of painting the previous file's tags onto this one
+        self._lex_generation += 1
         if not self.current_lexer:
             return
-
-        # Remove all existing Pygments-related tags from the text
-        # Exclude 'sel', 'found', 'occurrence_highlight', 'search_highlight'
-        tags_to_preserve = ('sel', 'found', 'occurrence_highlight', 'search_highlight')
-        for tag_name in self.file_editor.tag_names():
-            if tag_name not in tags_to_preserve:
+        if self._is_plain_text():
+            # Plain text needs no tags; just drop any left from a prior lexer
+            for tag_name in self._tags_used:
                 self.file_editor.tag_remove(tag_name, "1.0", tk.END)
-
-        code = self.file_editor.get("1.0", tk.END)
-        start_index = "1.0"
-
-        # Lex the code and apply tags based on token types
-        for token_type, content in lex(code, self.current_lexer):
-            end_index = self.file_editor.index(f"{start_index} + {len(content)}c")
-            self.file_editor.tag_add(str(token_type), start_index, end_index)
-            start_index = end_index
+            self._tags_used.clear()
+            self._update_line_numbers_content()
+            return
+        total_lines = int(self.file_editor.index('end-1c').split('.')[0])
+        self._highlight_range(1, total_lines)
 
         # Update line numbers after highlighting (in case content changed line count)
         self._update_line_numbers_content()
 
+    def _highlight_visible(self):
+        """
+        Schedules a background re-highlight of the lines currently visible.
+
+        Per-keystroke work becomes O(visible lines) instead of O(document):
+        most Pygments lexers reset their state at line boundaries, so lexing
+        just the on-screen slice produces the same tags for that region.
+        The lexing itself runs on the worker thread.
+        """
+        if not self.current_lexer:
+            return
+        first_line = int(self.file_editor.index("@0,0").split('.')[0])
+        last_line = int(self.file_editor.index(
+            "@0,%d" % self.file_editor.winfo_height()).split('.')[0])
+
+        code = self.file_editor.get(f"{first_line}.0", f"{last_line}.end")
+        self._lex_generation += 1
+        job = (self._lex_generation, code, self.current_lexer, first_line, last_line)
+        # Drop any not-yet-started job; only the newest snapshot matters
+        try:
+            self._lex_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._lex_queue.put(job)
+
+    def _lex_worker(self):
+        """
+        Daemon thread: lexes queued snapshots and posts tag ranges back.
+        Touches no Tk state; results are applied by _poll_lex_results on the
+        main thread.
+        """
+        while True:
+            generation, code, lexer, first_line, last_line = self._lex_queue.get()
+            # Tokens are streamed through a generator so only one token's
+            # content is alive at a time alongside the snapshot itself
+            tokens = ((str(token_type), content)
+                      for token_type, content in lex(code, lexer))
+            ranges_by_tag = _token_ranges(tokens, first_line)
+            # Drop the snapshot before blocking on the queue again, so the
+            # buffer copy is reclaimable while the worker sits idle
+            del code, tokens
+            self._lex_results.put((generation, first_line, last_line, ranges_by_tag))
+
+    def _poll_lex_results(self):
+        """
+        Applies finished background lex passes, dropping stale generations.
+        """
+        try:
+            while True:
+                generation, first_line, last_line, ranges_by_tag = self._lex_results.get_nowait()
+                if generation == self._lex_generation:
+                    self._apply_ranges(first_line, last_line, ranges_by_tag)
+        except queue.Empty:
+            pass
+        self.after(16, self._poll_lex_results)
+
+    def _highlight_range(self, start_line, end_line):
+        """
+        Lexes and re-tags the given line range (inclusive) synchronously.
+        Used for full-document passes where the result must be visible
+        immediately (file load, lexer change).
+        """
+        if not self.current_lexer:
+            return
+
+        code = self.file_editor.get(f"{start_line}.0", f"{end_line}.end")
+        tokens = ((str(token_type), content)
+                  for token_type, content in lex(code, self.current_lexer))
+        ranges_by_tag = _token_ranges(tokens, start_line)
+        # Release the text copy before the tag_add calls so peak memory is
+        # the ranges, not ranges plus a second copy of the buffer
+        del code, tokens
+        self._apply_ranges(start_line, end_line, ranges_by_tag)
+
+    def _apply_ranges(self, start_line, end_line, ranges_by_tag):
+        """
+        Replaces the Pygments tags in a line range with freshly computed ones.
+        Preserves selection, occurrence, and search highlight tags.
+        """
+        start = f"{start_line}.0"
+        end = f"{end_line}.end"
+
+        # Remove only the Pygments tags applied by earlier passes; selection,
+        # occurrence and search tags are never in this set, so they survive,
+        # and tags that were defined but never used cost nothing.
+        for tag_name in self._tags_used:
+            self.file_editor.tag_remove(tag_name, start, end)
+
+        for tag, flat_ranges in ranges_by_tag.items():
+            self.file_editor.tag_add(tag, *flat_ranges)
+        self._tags_used.update(ranges_by_tag)
+
     def _on_editor_content_change(self, event=None):
         """
         Event handler for content changes in the editor.
-        Triggers re-highlighting and line number updates.
+        Schedules re-highlighting and line number updates.
+
+        The actual work is debounced: rapid bursts of events (fast typing,
+        resize drags) coalesce into a single highlight pass per quiet period
+        instead of one full-buffer re-lex per event.
         """
-        self.highlight_text()
-        self._update_line_numbers_content()
+        self._buffer_dirty = True
+        self._content_hash = None
+        if self._highlight_job is not None:
+            self.after_cancel(self._highlight_job)
+        self._highlight_job = self.after(30, self._do_highlight)
         # The occurrence highlights are now cleared only when selection changes,
         # or when a new file is loaded, or when search dialog is closed.
         # This keeps them persistent while typing or scrolling without selection.
 
+    def _on_configure(self, event=None):
+        """
+        Event handler for widget resizes. Schedules a debounced line-number
+        refresh only; the syntax tags are unaffected by geometry changes.
+        """
+        if self._configure_job is not None:
+            self.after_cancel(self._configure_job)
+        self._configure_job = self.after(50, self._do_configure)
+
+    def _do_configure(self):
+        """Runs the debounced resize refresh."""
+        self._configure_job = None
+        self._update_line_numbers_content()
+
+    def _do_highlight(self):
+        """
+        Runs the debounced highlight pass scheduled by _on_editor_content_change.
+        """
+        self._highlight_job = None
+        if not self._is_plain_text():
+            self._highlight_visible()
+        self._update_line_numbers_content()
+
     def _on_editor_scroll_text_widget(self, *args):
         """
         Synchronizes the scrolling of the line number widget with the main editor.
+
+        yscrollcommand fires on every edit as well as on real scrolls, so
+        the fraction is cached and the line-number widget is only moved
+        when it actually changed.
         """
-        self.line_numbers.yview("moveto", args[0])
+        if args[0] != self._last_scroll_fraction:
+            self._last_scroll_fraction = args[0]
+            self.line_numbers.yview("moveto", args[0])
 
     def _update_line_numbers_content(self):
         """
         Updates the content of the line number widget.
-        Calculates the total number of lines in the editor and displays them.
+        Only the delta against the previously rendered count is touched, so
+        a single-line edit costs one insert/delete instead of rewriting
+        every line number.
         """
-        self.line_numbers.config(state="normal")  # Enable editing to update content
-        self.line_numbers.delete("1.0", tk.END)  # Clear existing line numbers
-
         # Get the total number of lines in the main editor
         total_lines = int(self.file_editor.index('end-1c').split('.')[0])
-        for i in range(1, total_lines + 1):
-            self.line_numbers.insert(tk.END, f"{i}\n")
+        if total_lines == self._line_count:
+            return
 
+        self.line_numbers.config(state="normal")  # Enable editing to update content
+        if total_lines > self._line_count:
+            new_numbers = "".join(f"{i}\n" for i in range(self._line_count + 1, total_lines + 1))
+            self.line_numbers.insert(tk.END, new_numbers)
+        else:
+            self.line_numbers.delete(f"{total_lines + 1}.0", tk.END)
+        self._line_count = total_lines
         self.line_numbers.config(state="disabled")  # Disable editing after update
 
     def get_text(self):
@@ -266,7 +590,10 @@ class CodeEditor(ctk.CTkFrame):
             filepath (str, optional): The path of the file being loaded. Defaults to None.
         """
         self.file_editor.delete("1.0", tk.END)  # Clear existing content
+        self._tags_used.clear()  # Tag ranges vanished with the old content
+        self._buffer_dirty = True
         self.file_editor.insert("1.0", text)  # Insert new content
+        self._content_hash = _hash_content(text)
         self.current_filepath = filepath
         if filepath:
             self.set_lexer(filepath)
@@ -280,6 +607,26 @@ class CodeEditor(ctk.CTkFrame):
         self.last_search_index = "1.0"
         self.current_search_match_indices = None
 
+    def content_matches(self, text):
+        """
+        Returns True when the given text is identical to what set_text last
+        loaded and no edits have happened since. Callers use this to skip a
+        redundant reload and its tokenization pass.
+        """
+        return self._content_hash is not None and self._content_hash == _hash_content(text)
+
+    def set_lexer_only(self, filename=''):
+        """
+        Re-applies the lexer for a new filename without reloading content.
+        For flows where only the path changed (rename, save-as), the text is
+        only re-tokenized if the lexer actually differs.
+        """
+        self.current_filepath = filename or None
+        new_lexer = self.get_lexer_from_filename(filename)
+        if type(new_lexer) is not type(self.current_lexer):
+            self.current_lexer = new_lexer
+            self.highlight_text()
+
     def _on_selection_change(self, event=None):
         """
         Highlights all occurrences of the selected text in the editor.
@@ -302,6 +649,31 @@ class CodeEditor(ctk.CTkFrame):
             # In this case, we want the highlights to persist, so do nothing here.
             pass
 
+    def _find_all_ranges(self, query):
+        """
+        Finds all case-insensitive occurrences of a query in one pass.
+
+        Reads the buffer once and scans it with re.finditer instead of one
+        Text.search Tcl call per match; character offsets are converted to
+        line.col indices with a line-start offset table.
+
+        Returns:
+            list: Flat list of alternating start/end index strings, suitable
+                for a single variadic tag_add call.
+        """
+        if self._buffer_dirty or self._buffer_snapshot is None:
+            self._buffer_snapshot = self.file_editor.get("1.0", tk.END)
+            self._buffer_line_starts = _line_start_offsets(self._buffer_snapshot)
+            self._buffer_dirty = False
+        text = self._buffer_snapshot
+        line_starts = self._buffer_line_starts
+
+        ranges = []
+        for match in re.finditer(re.escape(query), text, flags=re.IGNORECASE):
+            ranges.append(_offset_to_index(line_starts, match.start()))
+            ranges.append(_offset_to_index(line_starts, match.end()))
+        return ranges
+
     def _highlight_occurrences(self, text_to_highlight):
         """
         Finds and highlights all occurrences of a given text in the editor.
@@ -309,15 +681,9 @@ class CodeEditor(ctk.CTkFrame):
         if not text_to_highlight:
             return
 
-        start_index = "1.0"
-        while True:
-            # Use self.file_editor.search to find occurrences
-            start_index = self.file_editor.search(text_to_highlight, start_index, stopindex=tk.END, nocase=True)
-            if not start_index:
-                break
-            end_index = f"{start_index}+{len(text_to_highlight)}c"
-            self.file_editor.tag_add("occurrence_highlight", start_index, end_index)
-            start_index = end_index  # Continue search from the end of the current match
+        ranges = self._find_all_ranges(text_to_highlight)
+        if ranges:
+            self.file_editor.tag_add("occurrence_highlight", *ranges)
 
     def _show_search_dialog(self, event=None):
         """
@@ -436,7 +802,7 @@ class CodeEditor(ctk.CTkFrame):
             stopindex="1.0" if direction == "backward" else tk.END,
             nocase=True,
             backwards=(direction == "backward"),
-            count=tk.StringVar()  # Required for search to return a valid index
+            count=self._search_count_var  # Required for search to return a valid index
         )
 
         if found_index:
@@ -503,32 +869,28 @@ class CodeEditor(ctk.CTkFrame):
             return
 
         self.file_editor.tag_remove("search_highlight", "1.0", tk.END)  # Clear all search highlights first
-        self.file_editor.mark_set(tk.INSERT, "1.0")  # Move cursor to beginning for replace all
         self.last_search_index = "1.0"
         self.current_search_match_indices = None
 
-        count = 0
-        while True:
-            start_index = self.file_editor.search(query, "1.0", stopindex=tk.END, nocase=True)
-            if not start_index:
-                break
-            end_index = f"{start_index}+{len(query)}c"
-
-            self.file_editor.delete(start_index, end_index)
-            self.file_editor.insert(start_index, replace_with)
-            count += 1
-
-            # After insertion, the text shifts, so we need to adjust the starting point for the next search
-            # to be after the newly inserted text.
-            self.file_editor.update_idletasks()  # Ensure text widget updates its internal state
-            self.last_search_index = f"{start_index}+{len(replace_with)}c"
-            # Since we are modifying the text, the indices might shift.
-            # It's safer to restart the search from the beginning or use a more robust search mechanism
-            # that accounts for text changes. For simplicity here, we'll continue from the new position.
-            # A full-featured editor might re-scan the entire text after each replacement or use a regex-based approach.
+        # Do all replacements in a Python string and swap the widget contents
+        # once: one Tcl delete plus one insert regardless of match count,
+        # instead of a delete/insert/re-search cycle per occurrence.
+        text = self.file_editor.get("1.0", tk.END)
+        new_text, count = re.subn(re.escape(query), replace_with.replace('\\', r'\\'),
+                                  text, flags=re.IGNORECASE)
+        if count:
+            insert_index = self.file_editor.index(tk.INSERT)
+            yview = self.file_editor.yview()
+            self._buffer_dirty = True
+            self._content_hash = None # The buffer no longer matches what was loaded
+            self.file_editor.delete("1.0", tk.END)
+            self.file_editor.insert("1.0", new_text[:-1] if new_text.endswith('\n') else new_text)
+            # Restore the caret and scroll position as closely as possible
+            self.file_editor.mark_set(tk.INSERT, insert_index)
+            self.file_editor.yview_moveto(yview[0])
 
         messagebox.showinfo("Replace All", f"Replaced {count} occurrences.", parent=self.search_dialog)
-        self._on_editor_content_change()  # Re-highlight syntax and update line numbers
+        self.highlight_text()  # Full re-highlight once: the whole buffer was rewritten
 
     def _see_all_occurrences(self):
         """
@@ -542,16 +904,10 @@ class CodeEditor(ctk.CTkFrame):
         self.file_editor.tag_remove("search_highlight", "1.0", tk.END)  # Clear previous highlights
         self.current_search_match_indices = None
 
-        start_index = "1.0"
-        count = 0
-        while True:
-            start_index = self.file_editor.search(query, start_index, stopindex=tk.END, nocase=True)
-            if not start_index:
-                break
-            end_index = f"{start_index}+{len(query)}c"
-            self.file_editor.tag_add("search_highlight", start_index, end_index)
-            start_index = end_index  # Continue search from the end of the current match
-            count += 1
+        ranges = self._find_all_ranges(query)
+        count = len(ranges) // 2
+        if ranges:
+            self.file_editor.tag_add("search_highlight", *ranges)
 
         if count == 0:
             messagebox.showinfo("See All", f"'{query}' not found.", parent=self.search_dialog)
@@ -565,16 +921,70 @@ class FileExplorer(ctk.CTkFrame):
     displaying a tree view of files and directories.
     """
 
+    # Tk styles are global interpreter state; configure them once for the
+    # first explorer instead of re-running the configure/map calls per tab.
+    _style_initialized = False
+
     def __init__(self, master, root_path, editor_widget, **kwargs):
         super().__init__(master, **kwargs)
         self.root_path = os.path.abspath(root_path)
         self.editor_widget = editor_widget
         self.current_selected_path = None  # To store the path of the currently selected item in the treeview
 
+        # Pool for file reads/writes so multi-MB files never block the Tk
+        # main loop; results are marshaled back with after(0, ...)
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+
+        # iid -> 'dir'|'file', filled during tree population so selection and
+        # context-menu handlers don't re-stat paths the scandir pass already
+        # classified. Entries are dropped when their rows leave the tree.
+        self._type_cache = {}
+
+        # path -> (monotonic timestamp, stat result); short-TTL cache so
+        # rapid-fire UI interactions (context menu, refresh) don't repeat
+        # syscalls. Mutating handlers invalidate the affected paths.
+        self._stat_cache = {}
+
+        # Directories waiting for a refresh, coalesced by a trailing-edge
+        # debounce so N rapid mutations trigger one refresh per directory
+        self._refresh_pending = set()
+        self._refresh_job = None
+
+        # (path, mtime_ns, size) of the last file loaded into the editor;
+        # re-selecting the same unchanged file skips the disk read and the
+        # highlighting pass entirely
+        self._last_loaded = None
+
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
-        # Configure ttk.Treeview style to match customtkinter dark theme
+        if not FileExplorer._style_initialized:
+            self._setup_treeview_style()
+            FileExplorer._style_initialized = True
+
+        # Treeview widget for file exploration
+        self.tree = ttk.Treeview(self, show="tree", selectmode="browse")
+        self.tree.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+
+        # Scrollbars for the Treeview
+        self.vsb = ctk.CTkScrollbar(self, orientation="vertical", command=self.tree.yview)
+        self.vsb.grid(row=0, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=self.vsb.set)
+
+        self.hsb = ctk.CTkScrollbar(self, orientation="horizontal", command=self.tree.xview)
+        self.hsb.grid(row=1, column=0, sticky="ew", padx=5)
+        self.tree.configure(xscrollcommand=self.hsb.set)
+
+        # Bind selection, expansion and right-click events
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+        self.tree.bind("<Button-3>", self._show_context_menu)  # Right-click
+
+        self._populate_tree()
+
+    @staticmethod
+    def _setup_treeview_style():
+        """Configures the ttk.Treeview style to match the customtkinter dark theme."""
         style = ttk.Style()
         style.theme_use("default")  # Use default theme as a base
         style.configure("Treeview",
@@ -597,65 +1007,73 @@ class FileExplorer(ctk.CTkFrame):
         style.map("Treeview.Heading",
                   background=[('active', '#3C3F41')])
 
-        # Treeview widget for file exploration
-        self.tree = ttk.Treeview(self, show="tree", selectmode="browse")
-        self.tree.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-
-        # Scrollbars for the Treeview
-        self.vsb = ctk.CTkScrollbar(self, orientation="vertical", command=self.tree.yview)
-        self.vsb.grid(row=0, column=1, sticky="ns")
-        self.tree.configure(yscrollcommand=self.vsb.set)
-
-        self.hsb = ctk.CTkScrollbar(self, orientation="horizontal", command=self.tree.xview)
-        self.hsb.grid(row=1, column=0, sticky="ew", padx=5)
-        self.tree.configure(xscrollcommand=self.hsb.set)
-
-        # Bind selection and right-click events
-        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
-        self.tree.bind("<Button-3>", self._show_context_menu)  # Right-click
-
-        self._populate_tree()
-
     def _populate_tree(self, path=None, parent_iid=''):
         """
         Populates the Treeview with files and directories from the given path.
+        The directory scan runs on the I/O pool; rows are inserted back on
+        the Tk thread once the listing is ready.
         """
         if path is None:
             path = self.root_path
             self.tree.delete(*self.tree.get_children())  # Clear existing tree for root
+            self._type_cache.clear()
             self.tree.insert('', 'end', iid=path, text=os.path.basename(path) or path, open=True, tags=('dir',))
+            self._type_cache[path] = 'dir'
             parent_iid = path
 
-        try:
-            for item in sorted(os.listdir(path), key=lambda s: (not os.path.isdir(os.path.join(path, s)), s.lower())):
-                item_path = os.path.join(path, item)
-                if os.path.isdir(item_path):
-                    iid = self.tree.insert(parent_iid, 'end', iid=item_path, text=item, open=False, tags=('dir',))
-                    # Add a dummy child to indicate it's a directory and can be expanded
-                    self.tree.insert(iid, 'end', text='dummy')
-                elif os.path.isfile(item_path):
-                    self.tree.insert(parent_iid, 'end', iid=item_path, text=item, tags=('file',))
-        except OSError as e:
-            messagebox.showerror("File System Error", f"Could not read directory {path}: {e}")
+        future = self._io_pool.submit(self._scan_dir, path)
+        future.add_done_callback(
+            lambda fut, parent=parent_iid, p=path:
+                self.after(0, self._apply_scan, parent, p, fut))
 
-        self.tree.bind('<<TreeviewOpen>>', self._on_tree_open)
+    @staticmethod
+    def _scan_dir(path):
+        """
+        Lists a directory as (name, path, is_dir) rows; runs on the I/O pool.
+        os.scandir returns DirEntry objects whose is_dir()/is_file() reuse
+        the type info the kernel already returned with the directory read,
+        so each entry costs one syscall instead of a listdir plus two stats.
+        """
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
+        return [(e.name, e.path, e.is_dir()) for e in entries if e.is_dir() or e.is_file()]
+
+    def _apply_scan(self, parent_iid, path, future):
+        """Inserts rows from a finished background scan (main thread)."""
+        exc = future.exception()
+        if exc:
+            messagebox.showerror("File System Error", f"Could not read directory {path}: {exc}")
+            return
+        if not self.tree.exists(parent_iid):
+            return  # Parent vanished (rebuild/delete) while the scan ran
+        for name, entry_path, is_dir in future.result():
+            if self.tree.exists(entry_path):
+                continue
+            if is_dir:
+                iid = self.tree.insert(parent_iid, 'end', iid=entry_path, text=name, open=False,
+                                       tags=('dir',))
+                self._type_cache[entry_path] = 'dir'
+                # Sentinel child so the row shows an expand arrow; the real
+                # contents are read on first <<TreeviewOpen>>
+                self.tree.insert(iid, 'end', iid=f"{entry_path}::__stub__", text='')
+            else:
+                self.tree.insert(parent_iid, 'end', iid=entry_path, text=name, tags=('file',))
+                self._type_cache[entry_path] = 'file'
 
-    def _on_tree_open(self, event):
+    def _on_open(self, event):
         """
-        Handles the expansion of a directory in the Treeview.
-        Populates the expanded directory with its contents.
+        Handles the first expansion of a directory in the Treeview.
+        Replaces the sentinel child with the directory's real contents, so
+        each directory is scanned at most once and only when opened.
         """
         item_iid = self.tree.focus()
-        if not item_iid:
+        if not item_iid or self._type_cache.get(item_iid) != 'dir':
             return
 
-        item_path = item_iid
-        if os.path.isdir(item_path):
-            # Remove dummy child if it exists
-            if self.tree.get_children(item_iid) and self.tree.item(self.tree.get_children(item_iid)[0],
-                                                                   'text') == 'dummy':
-                self.tree.delete(self.tree.get_children(item_iid)[0])
-            self._populate_tree(path=item_path, parent_iid=item_iid)
+        children = self.tree.get_children(item_iid)
+        if children and children[0].endswith("::__stub__"):
+            self.tree.delete(children[0])
+            self._populate_tree(path=item_iid, parent_iid=item_iid)
 
     def _on_tree_select(self, event):
         """
@@ -668,17 +1086,56 @@ class FileExplorer(ctk.CTkFrame):
             return
 
         self.current_selected_path = selected_item_iid
-        if os.path.isfile(selected_item_iid):
+        if self._type_cache.get(selected_item_iid) == 'file':
             try:
-                with open(selected_item_iid, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.editor_widget.set_text(content, selected_item_iid)
-            except Exception as e:
-                messagebox.showerror("Error Opening File", f"Could not open {selected_item_iid}: {e}")
-                self.editor_widget.set_text("")  # Clear editor on error
+                st = os.stat(selected_item_iid)
+                signature = (selected_item_iid, st.st_mtime_ns, st.st_size)
+            except OSError:
+                signature = None
+            if (signature is not None and signature == self._last_loaded
+                    and self.editor_widget.current_filepath == selected_item_iid):
+                return  # Same unchanged file already in the editor
+
+            # Read on the I/O pool; the Tk thread stays responsive while a
+            # large or slow (network share) file loads
+            future = self._io_pool.submit(self._read_file, selected_item_iid)
+            future.add_done_callback(
+                lambda fut, path=selected_item_iid, sig=signature:
+                    self.after(0, self._apply_loaded_content, path, sig, fut))
         else:
             self.editor_widget.set_text("")  # Clear editor if a directory is selected
 
+    @staticmethod
+    def _read_file(path):
+        """Reads a file's content; runs on the I/O pool."""
+        # Read raw bytes with a wide buffer and decode once, instead of
+        # letting TextIOWrapper decode incrementally through a small buffer
+        with open(path, 'rb', buffering=1 << 20) as f:
+            # errors='replace' so a file with stray non-UTF-8 bytes still
+            # opens instead of raising, matching the remote read path
+            return f.read().decode('utf-8', errors='replace')
+
+    def _apply_loaded_content(self, path, signature, future):
+        """
+        Applies a finished background read to the editor (main thread).
+        Results for a file the user has already navigated away from are
+        dropped.
+        """
+        try:
+            content = future.result()
+        except Exception as e:
+            messagebox.showerror("Error Opening File", f"Could not open {path}: {e}")
+            self.editor_widget.set_text("")  # Clear editor on error
+            return
+        if self.current_selected_path != path:
+            return  # Selection moved on while the read was in flight
+        if (self.editor_widget.current_filepath == path
+                and self.editor_widget.content_matches(content)):
+            self._last_loaded = signature
+            return  # Identical content already displayed; skip the reload
+        self.editor_widget.set_text(content, path)
+        self._last_loaded = signature
+
     def _show_context_menu(self, event):
         """
         Displays a context menu on right-click in the Treeview.
@@ -719,13 +1176,44 @@ class FileExplorer(ctk.CTkFrame):
         finally:
             context_menu.grab_release()
 
+    def _cached_stat(self, path):
+        """
+        Stats a path, reusing a result younger than two seconds.
+        Propagates OSError for missing paths like os.stat does.
+        """
+        entry = self._stat_cache.get(path)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < 2.0:
+            return entry[1]
+        st = os.stat(path)
+        self._stat_cache[path] = (now, st)
+        return st
+
+    def _invalidate_stat(self, *paths):
+        """Drops cached stat results after a create/rename/delete."""
+        for path in paths:
+            self._stat_cache.pop(path, None)
+
+    def _is_dir(self, path):
+        """
+        Answers whether a path is a directory, preferring the tree's type
+        cache and falling back to the TTL stat cache for unknown paths.
+        """
+        kind = self._type_cache.get(path)
+        if kind is not None:
+            return kind == 'dir'
+        try:
+            return stat.S_ISDIR(self._cached_stat(path).st_mode)
+        except OSError:
+            return False
+
     def _get_target_path_for_new_item(self):
         """
         Determines the parent directory for a new file/directory.
         If a directory is selected, it's the parent. If a file is selected, its parent is the target.
         """
         if self.current_selected_path:
-            if os.path.isdir(self.current_selected_path):
+            if self._is_dir(self.current_selected_path):
                 return self.current_selected_path
             else:  # It's a file, so the parent directory is the target
                 return os.path.dirname(self.current_selected_path)
@@ -743,6 +1231,7 @@ class FileExplorer(ctk.CTkFrame):
             try:
                 with open(new_filepath, 'w') as f:
                     pass  # Create an empty file
+                self._invalidate_stat(new_filepath, target_dir)
                 self.refresh_tree_at_path(target_dir)
                 messagebox.showinfo("Success", f"File '{new_filename}' created.")
             except Exception as e:
@@ -759,6 +1248,7 @@ class FileExplorer(ctk.CTkFrame):
                 return
             try:
                 os.makedirs(new_dirpath)
+                self._invalidate_stat(new_dirpath, target_dir)
                 self.refresh_tree_at_path(target_dir)
                 messagebox.showinfo("Success", f"Directory '{new_dirname}' created.")
             except Exception as e:
@@ -770,17 +1260,21 @@ class FileExplorer(ctk.CTkFrame):
             return
 
         old_path = self.current_selected_path
-        old_name = os.path.basename(old_path)
+        # Split once: rpartition is a single scan vs. separate basename/dirname passes
+        parent_dir, _, old_name = old_path.rpartition(os.sep)
         new_name = simpledialog.askstring("Rename", f"Rename '{old_name}' to:", initialvalue=old_name, parent=self)
 
         if new_name and new_name != old_name:
-            parent_dir = os.path.dirname(old_path)
             new_path = os.path.join(parent_dir, new_name)
             if os.path.exists(new_path):
                 messagebox.showerror("Error", f"An item named '{new_name}' already exists in this location.")
                 return
             try:
                 os.rename(old_path, new_path)
+                self._invalidate_stat(old_path, new_path, parent_dir)
+                kind = self._type_cache.pop(old_path, None)
+                if kind:
+                    self._type_cache[new_path] = kind
                 # If the renamed item was the one open in editor, update editor's path
                 if self.editor_widget.current_filepath == old_path:
                     self.editor_widget.current_filepath = new_path
@@ -795,48 +1289,106 @@ class FileExplorer(ctk.CTkFrame):
             return
 
         item_to_delete = self.current_selected_path
-        item_name = os.path.basename(item_to_delete)
+        parent_dir, _, item_name = item_to_delete.rpartition(os.sep)
 
         confirm = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete '{item_name}'?", parent=self)
         if confirm:
-            try:
-                if os.path.isdir(item_to_delete):
-                    shutil.rmtree(item_to_delete)  # Delete directory and its contents
-                else:
-                    os.remove(item_to_delete)  # Delete file
+            # Delete on the I/O pool: rmtree walks and stats the whole
+            # subtree, which can block the UI for seconds on large trees
+            if self._type_cache.get(item_to_delete) == 'dir':
+                future = self._io_pool.submit(shutil.rmtree, item_to_delete)
+            else:
+                future = self._io_pool.submit(os.remove, item_to_delete)
+            future.add_done_callback(
+                lambda fut: self.after(0, self._on_delete_done,
+                                       item_to_delete, parent_dir, item_name, fut.exception()))
+
+    def _on_delete_done(self, item_to_delete, parent_dir, item_name, exc):
+        """Finalizes a background delete: updates caches, editor and tree (main thread)."""
+        if exc:
+            messagebox.showerror("Error", f"Could not delete '{item_name}': {exc}")
+            return
 
-                # If the deleted item was open in the editor, clear the editor
-                if self.editor_widget.current_filepath == item_to_delete:
-                    self.editor_widget.set_text("")
-                    self.editor_widget.current_filepath = None
+        self._type_cache.pop(item_to_delete, None)
+        self._invalidate_stat(item_to_delete, parent_dir)
 
-                parent_dir = os.path.dirname(item_to_delete)
-                self.refresh_tree_at_path(parent_dir)
-                messagebox.showinfo("Success", f"'{item_name}' deleted.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not delete '{item_name}': {e}")
+        # If the deleted item was open in the editor, clear the editor
+        if self.editor_widget.current_filepath == item_to_delete:
+            self.editor_widget.set_text("")
+            self.editor_widget.current_filepath = None
+
+        self.refresh_tree_at_path(parent_dir)
+        messagebox.showinfo("Success", f"'{item_name}' deleted.")
 
     def refresh_tree_at_path(self, path_to_refresh):
         """
-        Refreshes a specific part of the treeview after a file system change.
-        This involves deleting and re-inserting children of the parent directory.
+        Requests a refresh of a directory's rows.
+
+        Calls arriving in a burst (batch file creation, chained mutations)
+        are coalesced: the path joins a pending set and a single debounced
+        job flushes all of them after a 120ms quiet period.
+        """
+        self._refresh_pending.add(path_to_refresh)
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(120, self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Runs the coalesced directory refreshes."""
+        self._refresh_job = None
+        pending, self._refresh_pending = self._refresh_pending, set()
+        for path in pending:
+            self._do_refresh(path)
+
+    def _do_refresh(self, path_to_refresh):
         """
-        # Find the parent of the path_to_refresh in the tree
-        parent_iid = self.tree.parent(path_to_refresh)
-        if not parent_iid and path_to_refresh == self.root_path:
-            # If refreshing the root, just re-populate the entire tree
+        Refreshes a directory's rows after a file system change by diffing
+        the tree against a fresh scandir: only rows whose entries appeared
+        or disappeared are touched, so a single create/rename/delete costs
+        O(delta) Treeview operations instead of a full rebuild.
+        """
+        if path_to_refresh == self.root_path:
+            parent_iid = self.root_path
+        elif self.tree.exists(path_to_refresh) and self._type_cache.get(path_to_refresh) == 'dir':
+            parent_iid = path_to_refresh
+        else:
+            # Unknown directory (e.g. saved outside the tree): full rebuild
             self._populate_tree()
             return
-        elif not parent_iid:  # This means path_to_refresh is likely the root itself, but not explicitly handled by the first condition
-            parent_iid = self.root_path  # Assume root if not found and not the root itself
 
-        # Clear existing children of the parent
-        for child in self.tree.get_children(parent_iid):
-            self.tree.delete(child)
+        children = self.tree.get_children(parent_iid)
+        if len(children) == 1 and children[0].endswith("::__stub__"):
+            return  # Never expanded; real contents load on first open
+
+        current = {self.tree.item(c, 'text'): c for c in children}
+        try:
+            with os.scandir(parent_iid) as it:
+                fresh = {e.name: e for e in it}
+        except OSError as e:
+            messagebox.showerror("File System Error", f"Could not read directory {parent_iid}: {e}")
+            return
+
+        # Delete rows whose entries disappeared
+        for name, iid in current.items():
+            if name not in fresh:
+                self._type_cache.pop(iid, None)
+                self.tree.delete(iid)
+
+        # Insert rows for entries that are new, directories first
+        new_entries = sorted((entry for name, entry in fresh.items() if name not in current),
+                             key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
+        for entry in new_entries:
+            if entry.is_dir():
+                iid = self.tree.insert(parent_iid, 'end', iid=entry.path, text=entry.name, open=False,
+                                       tags=('dir',))
+                self._type_cache[entry.path] = 'dir'
+                self.tree.insert(iid, 'end', iid=f"{entry.path}::__stub__", text='')
+            elif entry.is_file():
+                self.tree.insert(parent_iid, 'end', iid=entry.path, text=entry.name, tags=('file',))
+                self._type_cache[entry.path] = 'file'
 
-        # Re-populate the parent directory
-        self._populate_tree(path=parent_iid, parent_iid=parent_iid)
         self.tree.item(parent_iid, open=True)  # Ensure the parent stays open
+        self.tree.update_idletasks()
 
 
 class App(ctk.CTk):
@@ -863,7 +1415,10 @@ class App(ctk.CTk):
         # File Explorer instance
         # Use a temporary directory for demonstration, or let the user choose
         self.initial_dir = os.path.join(os.path.expanduser("~"), "code_editor_files")
-        os.makedirs(self.initial_dir, exist_ok=True)  # Ensure the directory exists
+        if not os.path.isdir(self.initial_dir):
+            # One stat on the common path; makedirs walks the whole chain
+            # with stat+mkdir per component even when everything exists
+            os.makedirs(self.initial_dir, exist_ok=True)
 
         self.file_explorer = FileExplorer(self, root_path=self.initial_dir, editor_widget=self.code_editor,
                                           corner_radius=0)
@@ -886,15 +1441,35 @@ class App(ctk.CTk):
         content = self.code_editor.get_text()
 
         if filepath:
-            try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                messagebox.showinfo("Save File", f"File saved successfully to {os.path.basename(filepath)}")
-            except Exception as e:
-                messagebox.showerror("Save Error", f"Could not save file: {e}")
+            # Write on the explorer's I/O pool so large saves don't stall the UI
+            future = self.file_explorer._io_pool.submit(self._write_file, filepath, content)
+            future.add_done_callback(
+                lambda fut, path=filepath: self.after(0, self._on_save_done, path, fut))
         else:
             self._save_file_as()
 
+    @staticmethod
+    def _write_file(path, content):
+        """
+        Writes editor content to disk; runs on the I/O pool.
+        The encoded bytes go out in 64KiB memoryview slices, so no second
+        full-size copy of the buffer is allocated during the write.
+        """
+        data = content.encode('utf-8')
+        view = memoryview(data)
+        chunk_size = 1 << 16
+        with open(path, 'wb') as f:
+            for i in range(0, len(data), chunk_size):
+                f.write(view[i:i + chunk_size])
+
+    def _on_save_done(self, filepath, future):
+        """Reports the outcome of a background save (main thread)."""
+        exc = future.exception()
+        if exc:
+            messagebox.showerror("Save Error", f"Could not save file: {exc}")
+        else:
+            messagebox.showinfo("Save File", f"File saved successfully to {os.path.basename(filepath)}")
+
     def _save_file_as(self):
         """Prompts the user to save the current editor content to a new file."""
         filepath = filedialog.asksaveasfilename(
@@ -903,14 +1478,22 @@ class App(ctk.CTk):
             parent=self
         )
         if filepath:
-            try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(self.code_editor.get_text())
-                self.code_editor.set_text(self.code_editor.get_text(), filepath)  # Update editor's current_filepath
-                self.file_explorer.refresh_tree_at_path(os.path.dirname(filepath))  # Refresh explorer
-                messagebox.showinfo("Save File", f"File saved as {os.path.basename(filepath)}")
-            except Exception as e:
-                messagebox.showerror("Save Error", f"Could not save file: {e}")
+            content = self.code_editor.get_text()  # Pull the buffer once; reused below
+            future = self.file_explorer._io_pool.submit(
+                self._write_file, filepath, content)
+            future.add_done_callback(
+                lambda fut, path=filepath, text=content:
+                    self.after(0, self._on_save_as_done, path, text, fut))
+
+    def _on_save_as_done(self, filepath, content, future):
+        """Finalizes a background save-as: updates editor state and explorer."""
+        exc = future.exception()
+        if exc:
+            messagebox.showerror("Save Error", f"Could not save file: {exc}")
+            return
+        self.code_editor.set_text(content, filepath)  # Update editor's current_filepath
+        self.file_explorer.refresh_tree_at_path(os.path.dirname(filepath))  # Refresh explorer
+        messagebox.showinfo("Save File", f"File saved as {os.path.basename(filepath)}")
 
 
 if __name__ == "__main__":
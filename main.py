@@ -3,12 +3,12 @@ import tkinter as tk
 import multiprocessing
 import os
 import json
+import select
 import stat
 import socket
-import time
+import threading
 import queue
 import terminal # Assuming terminal.py exists and contains SSHTerminal class
-from multiprocessing.connection import Listener, Client
 from pygments.styles import get_style_by_name # Needed for pygments_style
 from editor import CodeEditor # Import the new CodeEditor class
 
@@ -21,25 +21,28 @@ CONFIG_FILE = "saved_hosts.json"
 
 
 # Background process SSH handler
-def ssh_worker(address):
+def ssh_worker(conn):
     """
     A separate process to handle SSH/SFTP connections and operations.
-    It listens for commands from the main process and executes them.
+    It receives commands from the main process over a persistent duplex
+    pipe and sends one reply per command; no per-operation connection
+    handshake is involved.
     """
     # Import paramiko here to avoid issues with multiprocessing on Windows
     # (paramiko is not picklable)
     from paramiko import SSHClient, AutoAddPolicy
     import paramiko
 
-    listener = Listener(address, authkey=b'ssh')
     ssh = None
     sftp = None
     shell = None
 
     while True:
-        conn = listener.accept() # Accept a connection from the main process
         try:
             msg = conn.recv() # Receive the command message
+        except EOFError:
+            break # Main process closed its end; shut down
+        try:
             cmd = msg["cmd"]
 
             if cmd == "connect":
@@ -58,11 +61,19 @@ def ssh_worker(address):
                 items = sftp.listdir_attr(path)
                 result = []
                 if path not in (".", "/", ""):
-                    result.append(("📁", "..")) # Add ".." for navigating up
+                    result.append(("📁", "..", True, 0)) # Add ".." for navigating up
                 for item in items:
-                    icon = "📁" if stat.S_ISDIR(item.st_mode) else "📄" # Determine icon based on file type
-                    result.append((icon, item.filename))
-                conn.send(result)
+                    # The SFTP server already returned the mode bits, so ship
+                    # them along: the UI can then tell files from directories
+                    # without a probing round trip per click
+                    is_dir = stat.S_ISDIR(item.st_mode)
+                    icon = "📁" if is_dir else "📄" # Determine icon based on file type
+                    result.append((icon, item.filename, is_dir, item.st_size))
+                # Stream bounded chunks so the UI can render the first rows
+                # before the whole listing has been pickled across the pipe
+                for i in range(0, len(result), 500):
+                    conn.send({"chunk": result[i:i + 500]})
+                conn.send({"done": True})
             elif cmd == "read_file":
                 # Read file content via SFTP
                 path = msg["path"]
@@ -79,16 +90,61 @@ def ssh_worker(address):
             elif cmd == "send_command":
                 # Send a command to the SSH shell
                 shell.send(msg["data"] + "\n")
-                time.sleep(0.1) # Give time for command to execute
+                # Wait up to 0.5s for the first bytes, then keep draining
+                # until the stream has been idle for 50ms: fast servers
+                # reply at near-RTT instead of paying a fixed 100ms sleep
                 output = b""
-                while shell.recv_ready(): # Read all available output
-                    output += shell.recv(4096)
+                timeout = 0.5
+                while True:
+                    readable, _, _ = select.select([shell], [], [], timeout)
+                    if not readable:
+                        break
+                    data = shell.recv(4096)
+                    if not data:
+                        break
+                    output += data
+                    timeout = 0.05
                 conn.send(output.strip()) # Send stripped output back
         except Exception as e:
             # Send error message back to the main process
             conn.send({"error": str(e)})
-        finally:
-            conn.close() # Close the connection after handling the command
+
+
+# Lazy module-level worker singleton: relaunching the App (e.g. from a
+# test harness) reuses the running worker instead of spawning a second
+# process and paying the paramiko import again
+_WORKER = None # (process, parent_conn) once started
+_WORKER_REFS = 0 # Number of live SSHClientApp instances using the worker
+_WORKER_LOCK = threading.Lock()
+
+
+def get_worker():
+    """Starts the SSH worker on first use and returns (process, pipe)."""
+    global _WORKER, _WORKER_REFS
+    with _WORKER_LOCK:
+        if _WORKER is None or not _WORKER[0].is_alive():
+            parent_conn, child_conn = multiprocessing.Pipe(duplex=True)
+            worker = multiprocessing.Process(target=ssh_worker, args=(child_conn,))
+            worker.start()
+            _WORKER = (worker, parent_conn)
+        _WORKER_REFS += 1
+        return _WORKER
+
+
+def release_worker():
+    """Drops one reference; terminates the worker when the last one goes."""
+    global _WORKER, _WORKER_REFS
+    with _WORKER_LOCK:
+        _WORKER_REFS -= 1
+        if _WORKER_REFS <= 0 and _WORKER is not None:
+            worker, parent_conn = _WORKER
+            _WORKER = None
+            _WORKER_REFS = 0
+            try:
+                parent_conn.close() # Signals EOF to the worker loop
+                worker.terminate()
+            except Exception:
+                pass
 
 
 class SSHClientApp(ctk.CTk):
@@ -104,29 +160,54 @@ class SSHClientApp(ctk.CTk):
 
         self.current_path = "." # Current remote directory path
         self.current_file = None # Currently opened remote file
+        self._entries = {} # name -> is_dir for the currently listed directory
 
         self.ui_queue = queue.Queue() # Queue for inter-process communication (not used in this version but kept)
-        self.hosts = self.load_hosts() # Load saved SSH hosts
+        self.hosts = self.load_hosts() # Load saved SSH hosts; in-memory list is authoritative
+        self._hosts_dirty = False # True while self.hosts has unwritten changes
+        self._hosts_flush_job = None # Handle of the pending debounced flush
         self.create_widgets() # Initialize UI widgets
         self.after(10, self.process_ui_queue) # Start processing UI queue (if used)
 
-        # Setup multiprocessing for SSH worker
-        self.process_address = ("localhost", 6000)
-        self.worker = multiprocessing.Process(target=ssh_worker, args=(self.process_address,))
-        self.worker.start() # Start the SSH worker process
+        # Shared SSH worker: one persistent duplex pipe instead of a
+        # connect/authkey handshake per operation, reused across App
+        # instances via the module-level singleton
+        self.worker, self._parent_conn = get_worker()
+        self._worker_lock = threading.Lock() # Serializes request/reply pairs on the pipe
 
     def load_hosts(self):
         """Loads saved host configurations from a JSON file."""
-        if not os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, "w") as f:
-                json.dump([], f) # Create an empty file if it doesn't exist
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
+        try:
+            with open(CONFIG_FILE, "r") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return [] # No config yet; the first save_hosts() will create it
+        if not content.strip():
+            return [] # Tolerate an empty/truncated file without a parse error
+        return json.loads(content)
 
     def save_hosts(self):
-        """Saves current host configurations to the JSON file."""
-        with open(CONFIG_FILE, "w") as f:
+        """
+        Schedules a write of the host list to the JSON file.
+
+        Writes are debounced (500ms) so a burst of edits costs one file
+        rewrite, and go through a temp file plus os.replace so a crash
+        mid-write can't leave a truncated config behind.
+        """
+        self._hosts_dirty = True
+        if self._hosts_flush_job is None:
+            self._hosts_flush_job = self.after(500, self._flush_hosts)
+
+    def _flush_hosts(self):
+        """Performs the debounced atomic write of the host list."""
+        self._hosts_flush_job = None
+        if not self._hosts_dirty:
+            return
+        self._hosts_dirty = False
+        tmp_file = CONFIG_FILE + ".tmp"
+        with open(tmp_file, "w") as f:
             json.dump(self.hosts, f, indent=4) # Save with indentation for readability
+        os.replace(tmp_file, CONFIG_FILE)
 
     def create_widgets(self):
         """Creates and arranges all UI widgets."""
@@ -204,14 +285,31 @@ class SSHClientApp(ctk.CTk):
             dict: The response from the worker process, or an error dictionary.
         """
         try:
-            conn = Client(self.process_address, authkey=b'ssh')
-            conn.send(message)
-            response = conn.recv()
-            conn.close()
-            return response
+            with self._worker_lock:
+                self._parent_conn.send(message)
+                return self._parent_conn.recv()
         except Exception as e:
             return {"error": str(e)}
 
+    def send_to_worker_stream(self, message):
+        """
+        Sends a message whose reply is streamed back in chunks.
+
+        Yields each {"chunk": [...]} payload (or a terminal error dict) until
+        the worker signals {"done": True}. The pipe lock is held for the
+        whole exchange so interleaved commands can't corrupt the stream.
+        """
+        with self._worker_lock:
+            self._parent_conn.send(message)
+            while True:
+                reply = self._parent_conn.recv()
+                if isinstance(reply, dict) and "error" in reply:
+                    yield reply
+                    return
+                if isinstance(reply, dict) and reply.get("done"):
+                    return
+                yield reply
+
     def refresh_host_list(self):
         """Clears and repopulates the host listbox with current saved hosts."""
         self.host_listbox.delete(0, tk.END)
@@ -261,15 +359,27 @@ class SSHClientApp(ctk.CTk):
         self.list_remote_dir() # List the remote directory after connection
 
     def list_remote_dir(self):
-        """Lists the contents of the current remote directory."""
-        res = self.send_to_worker({"cmd": "listdir", "path": self.current_path})
-        if "error" in res:
-            self.append_console(f"Error listing directory: {res['error']}")
-            return
+        """
+        Lists the contents of the current remote directory.
+        Entries arrive in chunks and are appended as they come in, so the
+        first rows render long before a huge listing finishes transferring.
+        """
         self.file_listbox.delete(0, tk.END) # Clear existing file list
+        self._entries = {} # Rebuilt from the stat data in each chunk
         self.path_label.configure(text=f"Path: {self.current_path}") # Update path label
-        for icon, name in res:
-            self.file_listbox.insert(tk.END, f"{icon} {name}") # Insert files/directories with icons
+        for reply in self.send_to_worker_stream({"cmd": "listdir", "path": self.current_path}):
+            if "error" in reply:
+                self.append_console(f"Error listing directory: {reply['error']}")
+                return
+            rows = []
+            for icon, name, is_dir, size in reply["chunk"]:
+                self._entries[name] = is_dir
+                rows.append(f"{icon} {name}")
+            if rows:
+                # One C-level insert per chunk instead of one Tcl call
+                # (and synchronous redraw) per row
+                self.file_listbox.insert(tk.END, *rows)
+            self.update_idletasks() # Let the UI paint between chunks
 
     def file_list_click(self, _):
         """
@@ -286,18 +396,28 @@ class SSHClientApp(ctk.CTk):
             return
 
         path = f"{self.current_path}/{name}".replace("//", "/") # Construct full path
-        res = self.send_to_worker({"cmd": "read_file", "path": path}) # Try to read as a file
-        if isinstance(res, dict) and "error" in res:
-            # If it's an error, assume it's a directory and try to list it
+        if self._entries.get(name, False):
+            # Known directory from the listing's stat bits: descend directly,
+            # no probing read_file round trip needed
             self.current_path = path
             self.list_remote_dir()
+            return
+
+        res = self.send_to_worker({"cmd": "read_file", "path": path})
+        if isinstance(res, dict) and "error" in res:
+            self.append_console(f"Error opening {path}: {res['error']}")
+            return
+        # It's a file: open in editor
+        self.current_file = path
+        self.tabview.set("Editor") # Switch to the editor tab
+        if self.editor_widget.content_matches(res):
+            # Same bytes already loaded: just make sure the lexer fits the
+            # path, skipping the full reload and tokenization
+            self.editor_widget.set_lexer_only(path)
         else:
-            # If successful, it's a file: open in editor
-            self.current_file = path
-            self.tabview.set("Editor") # Switch to the editor tab
             self.editor_widget.set_text(res) # Set text content using CodeEditor's method
             self.editor_widget.set_lexer(path) # Set lexer for syntax highlighting
-            self.append_console(f"Opened: {path}")
+        self.append_console(f"Opened: {path}")
 
     def animateButton(self,text,element):
         """
@@ -330,11 +450,15 @@ class SSHClientApp(ctk.CTk):
 
     def on_close(self):
         """Handles application shutdown, terminating the SSH worker process."""
+        try:
+            self._flush_hosts() # Persist any host edits still in the debounce window
+        except:
+            pass
         try:
             self.console_output.close() # Close terminal connection
-            self.worker.terminate() # Terminate the background SSH worker
         except:
             pass # Ignore errors during shutdown
+        release_worker() # Terminates the worker only if this was the last App
         self.destroy() # Destroy the main application window
 
 
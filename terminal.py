@@ -1,11 +1,35 @@
 import tkinter as tk
 from tkinter import scrolledtext
+import collections
+import functools
+import select
+import socket
 import threading
 import paramiko
-import time
-import queue
 import re
 
+# Optional native transport: ssh2-python wraps libssh2, whose AES runs
+# on AES-NI instead of paramiko's Python-level crypto. Falls back to
+# paramiko when the package isn't installed.
+try:
+    from ssh2.session import Session as _Ssh2Session
+except ImportError:
+    _Ssh2Session = None
+
+# Optional VT parser: pyte runs a real terminal state machine over the
+# stream (cursor motion, erase, scroll all handled), replacing the
+# regex pipeline in write_ansi when available.
+try:
+    import pyte
+except ImportError:
+    pyte = None
+
+# Opt-in for now: the input layer (enter_key, clearLine, addSpace,
+# write_text) still edits append-at-end and doesn't understand the fixed
+# screen rows the pyte renderer maintains, so enabling it by default
+# would send the blank reserved lines to the shell on every Enter.
+USE_PYTE_RENDERER = False
+
 ANSI_COLORS = {
     '30': 'gray',  # Black
     '31': 'red',
@@ -18,6 +42,176 @@ ANSI_COLORS = {
     '0': 'white',  # Reset
 }
 
+# Precompiled ANSI escape patterns. write_ansi runs on every received
+# chunk; compiling here keeps pattern parsing out of the hot path (and
+# off re's small shared cache)
+_RE_OSC = re.compile(r'\x1b\].*?(\x07|\x1b\\)')         # window title etc.
+_RE_CURSOR = re.compile(r'\x1b\[[0-9;]*[HfJK]')         # cursor moves, clears
+_RE_DEL1P = re.compile(r'\x1b\[1Pm')                    # cursor edit
+_RE_RIGHT = re.compile(r'\x1b\[C')                      # cursor right
+_RE_SGR = re.compile(r'\x1b\[([0-9;]*)m')             # SGR color codes
+
+# All the stripped sequences fused into one alternation, so one pass
+# over the text replaces the previous chain of per-pattern sub calls
+_RE_STRIP_ALL = re.compile(
+    r'\x1b\[[0-9;]*[HfJK]'    # cursor moves, clears
+    r'|\x1b\[6n'              # cursor position query
+    r'|\x1b\[\d*[A-HJ]'       # cursor move, erase line
+    r'|\x1b\[\d+;\d+[Hf]'     # move to row/col
+    r'|\x1b\[0?m'             # redundant reset
+    r'|\x1b\[1Pm'             # cursor edit
+)
+
+# Deletion table for the lone control bytes; str.translate runs in
+# straight C with no pattern-matching state, unlike the regex engine
+_CTRL_DEL = str.maketrans('', '', '\x08\x07')
+
+# The 27 color tag configurations are constant: build the (name,
+# options) pairs once at import instead of formatting them per instance
+_TAG_COLORS = ("black", "red", "green", "yellow", "blue", "magenta", "cyan", "white", "gray")
+_TAG_CONFIGS = []
+for _color in _TAG_COLORS:
+    _TAG_CONFIGS.append((f"ansi_{_color}", {'foreground': _color}))
+    _TAG_CONFIGS.append((f"ansi_bold_{_color}", {'foreground': _color, 'font': ("Courier New", 11, "bold")}))
+    _TAG_CONFIGS.append((f"ansi_ul_{_color}", {'foreground': _color, 'underline': True}))
+del _color
+
+
+@functools.lru_cache(maxsize=64)
+def _pyte_tag(fg, bold, underscore):
+    """Maps a pyte character's attributes to one of the ansi_* tags."""
+    color = {'brown': 'yellow', 'default': 'white'}.get(fg, fg)
+    if color not in ('black', 'red', 'green', 'yellow', 'blue',
+                     'magenta', 'cyan', 'white', 'gray'):
+        color = 'white' # 256-color / rgb values fall back to plain
+    if bold:
+        return f"ansi_bold_{color}"
+    if underscore:
+        return f"ansi_ul_{color}"
+    return f"ansi_{color}"
+
+
+@functools.lru_cache(maxsize=256)
+def _map_tag(code):
+    """
+    Maps an SGR code string (e.g. "31;1") to a text tag name.
+    A handful of codes dominate real output, so the split/lookup work is
+    memoized per distinct code string.
+    """
+    codes = code.split(';')
+    try:
+        base = codes[1] if codes else '0'
+        bold = '1' in codes[0]
+        underline = '4' in codes[0]
+    except:
+        base = codes[0]
+        bold = False
+        underline = False
+
+    color_map = {
+        '30': 'black',
+        '31': 'red',
+        '32': 'green',
+        '33': 'yellow',
+        '34': 'blue',
+        '35': 'magenta',
+        '36': 'cyan',
+        '37': 'white',
+        '90': 'gray'
+    }
+
+    color = color_map.get(base, 'white')
+    tag = f"ansi_{color}"
+    if bold:
+        tag = f"ansi_bold_{color}"
+    elif underline:
+        tag = f"ansi_ul_{color}"
+    return tag
+
+
+class _ParamikoBackend:
+    """
+    Default SSH transport. Exposes the small channel surface the terminal
+    uses (send/recv/closed/fileno/close) so the Tk layer doesn't care
+    which SSH library is underneath.
+    """
+    def __init__(self):
+        self.client = None
+        self.channel = None
+
+    def connect(self, hostname, username, password, port=22):
+        self.client = paramiko.SSHClient()
+        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self.client.connect(hostname, port=port, username=username, password=password)
+        self.channel = self.client.invoke_shell(term='xterm', width=200, height=24)
+        self.channel.settimeout(0.0)
+
+    def fileno(self):
+        return self.channel.fileno()
+
+    @property
+    def closed(self):
+        return self.channel is None or self.channel.closed
+
+    def send(self, data):
+        self.channel.send(data)
+
+    def recv(self, nbytes):
+        return self.channel.recv(nbytes)
+
+    def close(self):
+        if self.channel:
+            self.channel.close()
+        if self.client:
+            self.client.close()
+
+
+class _Ssh2Backend:
+    """
+    libssh2-based transport (ssh2-python). Same surface as
+    _ParamikoBackend; decrypt runs in native code, which matters on bulk
+    output like cat-ing a large file.
+    """
+    def __init__(self):
+        self.sock = None
+        self.session = None
+        self.channel = None
+        self._closed = False
+
+    def connect(self, hostname, username, password, port=22):
+        self.sock = socket.create_connection((hostname, port))
+        self.session = _Ssh2Session()
+        self.session.handshake(self.sock)
+        self.session.userauth_password(username, password)
+        self.channel = self.session.open_session()
+        self.channel.pty('xterm')
+        self.channel.shell()
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    @property
+    def closed(self):
+        return self._closed or self.channel is None or self.channel.eof()
+
+    def send(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self.channel.write(data)
+
+    def recv(self, nbytes):
+        size, data = self.channel.read(nbytes)
+        return data if size > 0 else b''
+
+    def close(self):
+        self._closed = True
+        if self.channel:
+            self.channel.close()
+        if self.session:
+            self.session.disconnect()
+        if self.sock:
+            self.sock.close()
+
 
 class SSHTerminal(tk.Frame):
     def __init__(self, master=None, hostname="", username="", password="", port=22, autoconnect=False,frame=None):
@@ -33,13 +227,25 @@ class SSHTerminal(tk.Frame):
         self.lastSize = 0
         self.detect = False
 
-        self.client = None
-        self.shell = None
-        self.queue = queue.Queue()
+        self.shell = None # Connected _ParamikoBackend/_Ssh2Backend
+        # Single producer (recv thread) / single consumer (Tk thread via
+        # after): deque's GIL-atomic append/popleft need no lock pair
+        self.queue = collections.deque()
+        self._flush_pending = False # True while a flush_queue is scheduled
 
         self.create_widgets()
         self.bind_keys()
 
+        # With the pyte renderer enabled, the stream feeds a VT screen
+        # and only dirty rows are redrawn; otherwise write_ansi parses
+        # directly
+        self._pyte_screen = None
+        self._pyte_stream = None
+        if pyte is not None and USE_PYTE_RENDERER:
+            self._pyte_screen = pyte.HistoryScreen(200, 24)
+            self._pyte_stream = pyte.Stream(self._pyte_screen)
+            self.text.insert('1.0', '\n' * self._pyte_screen.lines) # Reserve the screen rows
+
         if autoconnect:
             self.connect()
 
@@ -63,22 +269,10 @@ class SSHTerminal(tk.Frame):
         self.text.focus_set()
 
     def define_tags(self):
-        styles = {
-            "black": "#000000",
-            "red": "#ff4b4b",
-            "green": "#00ff00",
-            "yellow": "#ffff55",
-            "blue": "#5555ff",
-            "magenta": "#ff55ff",
-            "cyan": "#55ffff",
-            "white": "white",
-            "gray": "#888888",
-        }
-
-        for name, color in styles.items():
-            self.text.tag_config(f"ansi_{name}", foreground=name)
-            self.text.tag_config(f"ansi_bold_{name}", foreground=name, font=("Courier New", 11, "bold"))
-            self.text.tag_config(f"ansi_ul_{name}", foreground=name, underline=True)
+        # Tk tags belong to the widget, so each Text applies its own
+        # configs; the name/option pairs themselves come precomputed
+        for name, options in _TAG_CONFIGS:
+            self.text.tag_config(name, **options)
 
     def bind_keys(self):
         self.text.bind("<Key>", self.on_keypress)
@@ -99,12 +293,15 @@ class SSHTerminal(tk.Frame):
         self.text.bind('<Button-1>', self.on_mouseClick)
 
     def clearLine(self,min=1):
-        current_index = float(self.text.index(tk.INSERT))
+        # Tk indices are line.column pairs, not decimals: do the range
+        # math on the integer column instead of the old /100 float hack,
+        # which broke past column 9 and forced str/float conversions
+        line, col = map(int, self.text.index(tk.INSERT).split('.'))
         if self.writing != 0:
-            self.text.delete(str(current_index - (self.writing / 100)), str(current_index + min/100))
+            self.text.delete(f"{line}.{max(col - self.writing, 0)}", f"{line}.{col + min}")
             self.writing = 0
         if self.lastSize != 0:
-            self.text.delete(str(current_index - (self.lastSize/100)), str(current_index + min/100))
+            self.text.delete(f"{line}.{max(col - self.lastSize, 0)}", f"{line}.{col + min}")
             self.lastSize = 0
 
     def _send_up_and_break(self, event):
@@ -150,11 +347,9 @@ class SSHTerminal(tk.Frame):
             self.username = username
             self.password = password
             self.port = port
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            self.client.connect(self.hostname, port=self.port, username=self.username, password=self.password)
-            self.shell = self.client.invoke_shell(term='xterm', width=200, height=24)
-            self.shell.settimeout(0.0)
+            backend = _Ssh2Backend() if _Ssh2Session is not None else _ParamikoBackend()
+            backend.connect(self.hostname, self.username, self.password, port=self.port)
+            self.shell = backend
             threading.Thread(target=self.receive_data, daemon=True).start()
             self.write_text(f"Connected to {self.hostname}\n")
         except Exception as e:
@@ -162,69 +357,131 @@ class SSHTerminal(tk.Frame):
 
     def receive_data(self):
         firstDATA =0
-        while True:
-            if self.shell and self.shell.recv_ready():
-                try:
-                    data = self.shell.recv(4096)
-                    print(data)
-                    data = data.decode("utf-8", errors="ignore")
-                    self.queue.put(data)
-                    # noinspection PyTypeChecker
-                    self.master.after(1, self.flush_queue)
-                    if firstDATA == 0:
-                        self.addSpace(1)
-                        firstDATA = 1
-                except:
-                    break
-            time.sleep(0.05)
+        chan = self.shell
+        # select wakes as soon as bytes arrive instead of polling every
+        # 50 ms; the 1 s timeout only rechecks whether the channel closed
+        while chan is not None and not chan.closed:
+            readable, _, _ = select.select([chan], [], [], 1.0)
+            if not readable:
+                continue
+            try:
+                data = chan.recv(65536)
+            except:
+                break
+            if not data:
+                break
+            # Drop bracketed-paste toggles while the data is still bytes:
+            # a bytes.replace is cheaper than carrying them through the
+            # decode and regex pipeline. The \x07/\x08 bytes stay — the
+            # delete-detection heuristics in write_ansi inspect them.
+            data = data.replace(b'\x1b[?2004h', b'').replace(b'\x1b[?2004l', b'')
+            data = data.decode("utf-8", errors="ignore")
+            self.queue.append(data)
+            if not self._flush_pending:
+                # One scheduled flush drains everything queued by
+                # then; ~60 Hz refresh instead of one per packet
+                self._flush_pending = True
+                # noinspection PyTypeChecker
+                self.master.after(16, self.flush_queue)
+            if firstDATA == 0:
+                self.addSpace(1)
+                firstDATA = 1
 
     def flush_queue(self):
-        while not self.queue.empty():
-            data = self.queue.get()
-            self.write_ansi(data)
+        self._flush_pending = False
+        # Drain by popping until empty rather than testing emptiness
+        # first: one atomic operation per item, and no window for another
+        # consumer between the check and the pop
+        parts = []
+        while True:
+            try:
+                parts.append(self.queue.popleft())
+            except IndexError:
+                break
+        if parts:
+            # One parse pass (and one redraw) per drain instead of one
+            # per 4 KiB chunk
+            text = ''.join(parts)
+            if self._pyte_stream is not None:
+                self._pyte_stream.feed(text)
+                self._render_pyte()
+            else:
+                self.write_ansi(text)
+
+    def _render_pyte(self):
+        """Redraws only the rows pyte marked dirty since the last flush."""
+        screen = self._pyte_screen
+        if not screen.dirty:
+            return
+        for row_no in sorted(screen.dirty):
+            if row_no >= screen.lines:
+                continue
+            row = screen.buffer[row_no]
+            segs = []
+            run = []
+            run_tag = None
+            for x in range(screen.columns):
+                ch = row[x]
+                tag = _pyte_tag(ch.fg, ch.bold, ch.underscore)
+                if tag != run_tag and run:
+                    segs.append(''.join(run))
+                    segs.append(run_tag)
+                    run = []
+                run_tag = tag
+                run.append(ch.data)
+            if run:
+                segs.append(''.join(run).rstrip())
+                segs.append(run_tag)
+            line = row_no + 1 # Screen row r lives on widget line r+1
+            self.text.delete(f"{line}.0", f"{line}.end")
+            if segs:
+                self.text.insert(f"{line}.0", *segs)
+        screen.dirty.clear()
+        self.text.mark_set(tk.INSERT, f"{screen.cursor.y + 1}.{screen.cursor.x}")
+        self.prompt_index = self.text.index(tk.INSERT)
+        self.text.see(tk.INSERT)
 
     def write_text(self, text):
         self.text.insert(tk.END, text)
         self.text.see(tk.END)
 
     def GetEndLock(self):
-        lastLoc = self.text.index(tk.INSERT + "")
-        self.text.mark_set(tk.INSERT, tk.END)
-        endLoc = self.text.index(tk.INSERT)
-        self.text.mark_set(tk.INSERT, lastLoc)
-        return endLoc != lastLoc
+        # One Tcl compare instead of two mark_set round trips plus two
+        # index reads
+        return not self.text.compare(tk.INSERT, '==', 'end-1c')
 
     def write_ansi(self, text=''):
-        if text != re.sub(r'\x1b\[[0-9;]*[HfJK]', '',text):
-            self.deleteCharacter()
-        elif text != re.sub(r'\x1b\[1Pm', '',text):
+        # Fast path: no escape/backspace/bell bytes means nothing to
+        # strip or color (cat output, build logs) — one insert and done
+        if not ('\x1b' in text or '\x08' in text or '\x07' in text):
+            self.text.insert(tk.END, text)
+            self.prompt_index = self.text.index("end-1c")
+            self.text.see(tk.END)
+            return
+
+        # Cheap membership tests (C-level memchr) gate the guard regexes,
+        # so plain text skips them without a single full regex scan
+        has_esc = '\x1b' in text
+        has_bs = '\x08' in text
+        if has_esc and _RE_CURSOR.search(text):
             self.deleteCharacter()
-        elif not self.GetEndLock() and len(re.sub(r'\x08', '', text)) > 1 and not '' == re.sub(r'\x08', '', text) and text == re.sub(r'\x07', '', text) and text == re.sub(r'\x1b\[C', '', text):
-            print('delete')
+        elif has_esc and _RE_DEL1P.search(text):
             self.deleteCharacter()
+        else:
+            stripped_len = len(text) - text.count('\x08') if has_bs else len(text)
+            if (not self.GetEndLock() and stripped_len > 1 and '\x07' not in text
+                    and not (has_esc and _RE_RIGHT.search(text))):
+                self.deleteCharacter()
 
-        # Remove OSC sequences (set window title)
-        text = re.sub(r'\x1b\].*?(\x07|\x1b\\)', 'n1n', text)
-
-        text = re.sub(r'\x08', '', text) # left when not the end # \x1b\[C for the right not the end
-        text = re.sub(r'\x07', '',text) # x07 mean the end of the cursor left and right !
-
-        # Remove bracketed paste mode
-        text = re.sub(r'\x1b\[\?2004[hl]', '', text)
-        # Remove cursor movements, clears
-        text = re.sub(r'\x1b\[[0-9;]*[HfJK]', '', text)
-        # Remove cursor position requests
-        text = re.sub(r'\x1b\[6n', '', text)
-
-        # Remove unhandled control sequences (cursor move, bracketed paste, etc)
-        text = re.sub(r'\x1b\[\?2004[hl]', '', text)  # bracketed paste
-        text = re.sub(r'\x1b\[\d*[A-HJ]', '', text)  # cursor move, erase line
-        text = re.sub(r'\x1b\[\d+;\d+[Hf]', '', text)  # move to row/col
-        text = re.sub(r'\x1b\[6n', '', text)  # cursor position query
-        text = re.sub(r'\x1b\[0?m', '', text)  # redundant reset
+        # Remove OSC sequences (set window title); must run before the
+        # combined strip so the terminating BEL isn't eaten first
+        text = _RE_OSC.sub('', text)
 
-        # remove the cursor edit
-        text = re.sub(r'\x1b\[1Pm', '', text)
+        # Drop the backspace/bell bytes (\x08 = cursor left, \x07 =
+        # cursor end) with a translate table, then one regex pass for
+        # every unhandled control sequence
+        text = text.translate(_CTRL_DEL)
+        text = _RE_STRIP_ALL.sub('', text)
 
 
         # store the up or down size for the clear line
@@ -235,64 +492,34 @@ class SSHTerminal(tk.Frame):
 
 
         # ANSI color escape parser
-        ansi_escape = re.compile(r'\x1b\[([0-9;]*)m')
-        parts = ansi_escape.split(text)
+        # Walk the SGR matches with finditer instead of split + pop(0):
+        # no parts list to allocate and no quadratic pops from the head.
+        # Each segment takes the tag of the code that *precedes* it.
+        # Accumulate interleaved (text, tags) pairs; Text.insert accepts
+        # them in one call, so the whole chunk costs a single Tcl
+        # round-trip instead of one per color segment
         current_tag = ""
-
-        while parts:
-            chunk = parts.pop(0)
-            if parts:
-                code = parts.pop(0)
-                tag = self.map_tag(code)
-                if tag:
-                    current_tag = tag
+        segs = []
+        prev = 0
+        for m in _RE_SGR.finditer(text):
+            chunk = text[prev:m.start()]
             if chunk:
-                try:
-                    an = re.findall(r'\"[^\"]*\"|\'[^\']*\'|\S+', chunk)
-                    for index, item in enumerate(an):
-                        # Modify the item (e.g., double it)
-                        an[index] = re.sub(r'n1n','\n',an[index])
-                    if current_tag == '':
-                        forceStop = 10 / 0  # to force stop the loop idk what to do else
-                    self.text.insert(tk.END, an[0] + ' ', current_tag)
-                    self.text.insert(tk.END, " ".join(an[1:]))
-                except:
-                    self.text.insert(tk.END, re.sub(r'n1n','\n',chunk))
+                segs.append(chunk)
+                segs.append(current_tag or ())
+            tag = _map_tag(m.group(1))
+            if tag:
+                current_tag = tag
+            prev = m.end()
+        tail = text[prev:]
+        if tail:
+            segs.append(tail)
+            segs.append(current_tag or ())
+        if segs:
+            self.text.insert(tk.END, *segs)
 
         self.prompt_index = self.text.index("end-1c")
         self.text.see(tk.END)
 
-    def map_tag(self, code):
-        codes = code.split(';')
-        try:
-            base = codes[1] if codes else '0'
-            bold = '1' in codes[0]
-            underline = '4' in codes[0]
-        except:
-            base = codes[0]
-            bold = False
-            underline = False
-
-        color_map = {
-            '30': 'black',
-            '31': 'red',
-            '32': 'green',
-            '33': 'yellow',
-            '34': 'blue',
-            '35': 'magenta',
-            '36': 'cyan',
-            '37': 'white',
-            '90': 'gray'
-        }
-
-        color = color_map.get(base, 'white')
-        tag = f"ansi_{color}"
-        if bold:
-            tag = f"ansi_bold_{color}"
-        elif underline:
-            tag = f"ansi_ul_{color}"
-        return tag
-
     def on_mouseClick(self,event):
         self.set_cursor_to_end()
         self.text.focus_force()
@@ -305,7 +532,7 @@ class SSHTerminal(tk.Frame):
 
         if event.char and event.char.isprintable():
             try:
-                self.writing =+ 1
+                self.writing += 1
                 self.shell.send(event.char)
             except:
                 pass
@@ -339,8 +566,9 @@ class SSHTerminal(tk.Frame):
         self.text.mark_set(tk.INSERT, tk.END)
         self.text.see(tk.END)
 
-    def deleteCharacter(self):
-        index = self.text.index(tk.INSERT)
+    def deleteCharacter(self, index=None):
+        if index is None:
+            index = self.text.index(tk.INSERT)
         line, char = map(int, index.split('.'))
 
         if char == 0:
@@ -362,6 +590,4 @@ class SSHTerminal(tk.Frame):
 
     def close(self):
         if self.shell:
-            self.shell.close()
-        if self.client:
-            self.client.close()
+            self.shell.close() # Backend closes its own channel/client/socket